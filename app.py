@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+import queue
 import sys
 
 from PySide6.QtWidgets import QApplication
@@ -11,10 +14,23 @@ from PySide6.QtWidgets import QApplication
 from ui import MainWindow
 
 
+_logging_configured = False
+
+
 def configure_logging() -> None:
-    """Configure console and file logging for the application."""
+    """Configure console and file logging for the application.
+
+    Records are handed to a background listener thread so console and file writes
+    never block the GUI or scan threads. Calls after the first are no-ops.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+
     log_dir = Path.cwd() / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
+    if not log_dir.is_dir():
+        log_dir.mkdir(parents=True)
     log_file = log_dir / "random_home_movie_channel.log"
 
     formatter = logging.Formatter(
@@ -28,12 +44,27 @@ def configure_logging() -> None:
     stream_handler = logging.StreamHandler(sys.stdout)
     stream_handler.setFormatter(formatter)
 
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    file_handler = RotatingFileHandler(
+        log_file,
+        maxBytes=10 * 1024 * 1024,
+        backupCount=3,
+        encoding="utf-8",
+        delay=True,
+    )
     file_handler.setFormatter(formatter)
 
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue,
+        stream_handler,
+        file_handler,
+        respect_handler_level=True,
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
     root_logger.handlers.clear()
-    root_logger.addHandler(stream_handler)
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(QueueHandler(log_queue))
 
     logging.getLogger(__name__).info("Logging initialized. Writing logs to %s", log_file)
 
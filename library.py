@@ -2,28 +2,49 @@
 
 from __future__ import annotations
 
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 import logging
 import os
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable, Iterator
 
 
 LOGGER = logging.getLogger(__name__)
 
+# Directory listing is I/O bound and releases the GIL, so this can exceed the CPU count.
+_SCAN_WORKERS = 32
 
-@dataclass(slots=True)
+# Report scan progress roughly once per this many files seen.
+_PROGRESS_INTERVAL = 256
+
+_IGNORED_NAMES = frozenset(
+    {
+        "$recycle.bin",
+        "system volume information",
+        "__macosx",
+        "node_modules",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
 class VideoItem:
-    """Represents a discovered local video file."""
+    """Represents a discovered local video file by its absolute path string."""
+
+    path: str
+    name: str  # file name without the folder part, captured at scan time
+
 
-    path: Path
+# Result of listing a single folder: (videos, subfolders, non-folder entry count).
+_FolderListing = tuple[list[VideoItem], list[str], int]
 
 
 class VideoLibrary:
     """In-memory video library with recursive discovery support."""
 
     def __init__(self) -> None:
-        self._items: list[VideoItem] = []
+        self._items: tuple[VideoItem, ...] = ()
         self._root_folder: Path | None = None
 
     @property
@@ -32,49 +53,92 @@ class VideoLibrary:
         return self._root_folder
 
     @property
-    def items(self) -> list[VideoItem]:
-        """Copy of currently discovered videos."""
-        return list(self._items)
+    def items(self) -> tuple[VideoItem, ...]:
+        """Currently discovered videos, as an immutable tuple shared between reads."""
+        return self._items
 
     def set_items(self, root_folder: Path, items: Iterable[VideoItem]) -> None:
         """Update the library after a scan completes."""
         self._root_folder = root_folder
-        self._items = list(items)
+        self._items = tuple(items)
 
     @staticmethod
-    def scan_folder(root_folder: Path) -> list[VideoItem]:
-        """Recursively discover .mp4 files under root_folder.
+    def scan_folder(
+        root_folder: Path,
+        on_progress: Callable[[int, int], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> Iterator[VideoItem]:
+        """Recursively discover .mp4 files under root_folder, yielding them as found.
 
         Hidden/system-like folders and hidden files are skipped when practical.
+        on_progress, if given, is called with (files seen, files matched) about every
+        256 files. should_stop, if given, is checked after each folder is listed; once it
+        returns True the scan ends early without listing the remaining folders.
         """
-        LOGGER.info("Scanning folder: %s", root_folder)
+        LOGGER.debug("Scanning folder: %s", root_folder)
         if not root_folder.exists() or not root_folder.is_dir():
             raise ValueError(f"Invalid folder: {root_folder}")
 
-        discovered: list[VideoItem] = []
-
-        for current_root, dirs, files in os.walk(root_folder):
-            dirs[:] = [d for d in dirs if not _is_hidden_or_system_name(d)]
-
-            current_path = Path(current_root)
-            for filename in files:
-                if _is_hidden_or_system_name(filename):
+        dirs_seen = 0
+        files_seen = 0
+        matched = 0
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS, thread_name_prefix="scan") as pool:
+            pending: set[Future[_FolderListing]] = {
+                pool.submit(_scan_directory, os.fspath(root_folder))
+            }
+            while pending:
+                if should_stop is not None and should_stop():
+                    for future in pending:
+                        future.cancel()
+                    LOGGER.info("Scan stopped early: root=%s", root_folder)
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    videos, subdirs, file_count = future.result()
+                    pending.update(pool.submit(_scan_directory, subdir) for subdir in subdirs)
+                    dirs_seen += 1
+                    previous_files_seen = files_seen
+                    files_seen += file_count
+                    matched += len(videos)
+                    if (
+                        on_progress is not None
+                        and files_seen // _PROGRESS_INTERVAL
+                        != previous_files_seen // _PROGRESS_INTERVAL
+                    ):
+                        on_progress(files_seen, matched)
+                    yield from videos
+
+        LOGGER.info(
+            "Scan complete: root=%s dirs=%d files=%d matched=%d",
+            root_folder,
+            dirs_seen,
+            files_seen,
+            matched,
+        )
+
+
+def _scan_directory(path: str) -> _FolderListing:
+    """List one folder, returning its .mp4 files, subfolders to visit and file count."""
+    videos: list[VideoItem] = []
+    subdirs: list[str] = []
+    file_count = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                lowered = entry.name.lower()
+                if _is_hidden_or_system_name(lowered):
                     continue
-                full_path = current_path / filename
-                if full_path.suffix.lower() == ".mp4":
-                    discovered.append(VideoItem(path=full_path))
-
-        LOGGER.info("Discovered %d mp4 files", len(discovered))
-        return discovered
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    continue
+                file_count += 1
+                if lowered.endswith(".mp4") and entry.is_file():
+                    videos.append(VideoItem(path=entry.path, name=entry.name))
+    except OSError as exc:
+        LOGGER.warning("Skipping unreadable folder %s: %s", path, exc)
+    return videos, subdirs, file_count
 
 
 def _is_hidden_or_system_name(name: str) -> bool:
-    """Best-effort hidden/system detection based on path segment names."""
-    if name.startswith("."):
-        return True
-    return name.lower() in {
-        "$recycle.bin",
-        "system volume information",
-        "__macosx",
-        "node_modules",
-    }
+    """Best-effort hidden/system detection based on lowercased path segment names."""
+    return not name or name[0] == "." or name in _IGNORED_NAMES
@@ -2,25 +2,31 @@
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
 import logging
-from pathlib import Path
 import random
-from typing import Callable
+from typing import Callable, Sequence
 
 from PySide6.QtCore import QTimer, QUrl, QObject, Signal, Slot
 from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
 from PySide6.QtMultimediaWidgets import QVideoWidget
 
+from library import VideoItem
+
 
 LOGGER = logging.getLogger(__name__)
 
+# How long to wait for a loaded file to report its duration before skipping it.
+_DURATION_TIMEOUT_MS = 5000
+
 
 @dataclass(slots=True)
 class SegmentInfo:
     """Runtime details for a currently scheduled/playing segment."""
 
-    file_path: Path
+    file_path: str
+    file_name: str
     start_ms: int
     duration_ms: int
     playlist_index: int
@@ -28,7 +34,7 @@ class SegmentInfo:
 
 
 class SegmentPlayer(QObject):
-    """Controls media playback and segment scheduling over a shuffled playlist."""
+    """Controls media playback and segment scheduling over a randomly ordered playlist."""
 
     segment_changed = Signal(object)  # SegmentInfo
     playback_error = Signal(str)
@@ -45,14 +51,26 @@ class SegmentPlayer(QObject):
         self._segment_end_timer.setSingleShot(True)
         self._segment_end_timer.timeout.connect(on_next_requested)
 
-        self._playlist: list[Path] = []
+        self._duration_timeout_timer = QTimer(self)
+        self._duration_timeout_timer.setSingleShot(True)
+        self._duration_timeout_timer.setInterval(_DURATION_TIMEOUT_MS)
+        self._duration_timeout_timer.timeout.connect(self._on_duration_timeout)
+
+        self._playlist: Sequence[VideoItem] = ()
+        self._urls: list[QUrl | None] = []
+        self._order = array("L")
         self._index = -1
         self._loop = True
         self._playing = False
 
+        self._remaining_ms: int | None = None
+        self._pending_item: VideoItem | None = None
+        self._pending_min_seconds = 0
+        self._pending_max_seconds = 0
         self._pending_start_ms: int | None = None
 
         self.media_player.mediaStatusChanged.connect(self._on_media_status_changed)
+        self.media_player.durationChanged.connect(self._on_duration_changed)
         self.media_player.errorOccurred.connect(self._on_error)
 
     def set_volume(self, value: int) -> None:
@@ -61,8 +79,13 @@ class SegmentPlayer(QObject):
     def set_muted(self, is_muted: bool) -> None:
         self.audio_output.setMuted(is_muted)
 
-    def configure_playlist(self, playlist: list[Path], loop: bool = True) -> None:
-        self._playlist = list(playlist)
+    def configure_playlist(self, playlist: Sequence[VideoItem], loop: bool = True) -> None:
+        # Only read, never reordered, so the caller's sequence (typically the library's
+        # shared items tuple) is kept as-is instead of being copied.
+        self._playlist = playlist
+        # URLs are built on first draw and kept, so Start doesn't pay for the whole library.
+        self._urls = [None] * len(playlist)
+        self._order = array("L", range(len(self._playlist)))
         self._index = -1
         self._loop = loop
         self._playing = False
@@ -81,13 +104,16 @@ class SegmentPlayer(QObject):
     def resume(self) -> None:
         if self.media_player.playbackState() == QMediaPlayer.PlaybackState.PausedState:
             self.media_player.play()
-            remaining = getattr(self, "_remaining_ms", None)
+            remaining = self._remaining_ms
+            self._remaining_ms = None
             if remaining is not None and remaining > 0:
                 self._segment_end_timer.start(remaining)
 
     def stop(self) -> None:
         self._playing = False
         self._segment_end_timer.stop()
+        self._duration_timeout_timer.stop()
+        self._pending_item = None
         self.media_player.stop()
 
     def play_next_segment(self, min_seconds: int, max_seconds: int) -> None:
@@ -97,42 +123,75 @@ class SegmentPlayer(QObject):
 
         self._playing = True
         self._index += 1
-        if self._index >= len(self._playlist):
+        total = len(self._playlist)
+        if self._index >= total:
             if not self._loop:
                 self.stop()
                 self.queue_empty.emit()
                 return
-            random.shuffle(self._playlist)
             self._index = 0
 
-        file_path = self._playlist[self._index]
-        self._schedule_segment(file_path, min_seconds, max_seconds)
-
-    def _schedule_segment(self, file_path: Path, min_seconds: int, max_seconds: int) -> None:
+        # Incremental Fisher-Yates over playlist indices: draw one random remaining entry
+        # per segment, so a session never pays for shuffling the whole playlist up front
+        # or on each pass, and the path and URL lists are never reordered.
+        index = self._index
+        pick = random.randrange(index, total)
+        order = self._order
+        order[index], order[pick] = order[pick], order[index]
+        entry = order[index]
+        item = self._playlist[entry]
+        url = self._urls[entry]
+        if url is None:
+            url = self._urls[entry] = QUrl.fromLocalFile(item.path)
+        self._schedule_segment(item, url, min_seconds, max_seconds)
+
+    def _schedule_segment(
+        self, item: VideoItem, url: QUrl, min_seconds: int, max_seconds: int
+    ) -> None:
         min_seconds = max(1, min_seconds)
         max_seconds = max(min_seconds, max_seconds)
 
         # Duration is unknown until media is loaded; store plan and finish in callback.
-        self._pending_file = file_path
+        self._pending_item = item
         self._pending_min_seconds = min_seconds
         self._pending_max_seconds = max_seconds
         self._pending_start_ms = None
+        # A timeout armed for a previous file must not skip this one while it loads.
+        self._duration_timeout_timer.stop()
 
-        self.media_player.stop()
-        self.media_player.setSource(QUrl.fromLocalFile(str(file_path)))
+        # setSource() tears down the previous media itself; an explicit stop() first
+        # would add a redundant backend state change.
+        self.media_player.setSource(url)
 
     @Slot("QMediaPlayer::MediaStatus")
     def _on_media_status_changed(self, status: QMediaPlayer.MediaStatus) -> None:
         if status != QMediaPlayer.MediaStatus.LoadedMedia:
             return
 
-        if not hasattr(self, "_pending_file"):
+        if self._pending_item is None:
             return
 
+        # Some backends report LoadedMedia before the duration is known; in that case
+        # _on_duration_changed starts the segment once the duration arrives, and the
+        # timeout skips files that never report one.
         duration_ms = self.media_player.duration()
-        if duration_ms <= 0:
-            self.playback_error.emit(f"Could not read duration: {self._pending_file}")
+        if duration_ms > 0:
+            self._start_pending_segment(duration_ms)
+        else:
+            self._duration_timeout_timer.start()
+
+    @Slot("qint64")
+    def _on_duration_changed(self, duration_ms: int) -> None:
+        if duration_ms <= 0 or self._pending_item is None:
+            return
+        if self.media_player.mediaStatus() != QMediaPlayer.MediaStatus.LoadedMedia:
             return
+        self._start_pending_segment(duration_ms)
+
+    def _start_pending_segment(self, duration_ms: int) -> None:
+        item = self._pending_item
+        self._pending_item = None
+        self._duration_timeout_timer.stop()
 
         min_ms = self._pending_min_seconds * 1000
         max_ms = self._pending_max_seconds * 1000
@@ -149,7 +208,8 @@ class SegmentPlayer(QObject):
         self._pending_start_ms = start_ms
 
         info = SegmentInfo(
-            file_path=self._pending_file,
+            file_path=item.path,
+            file_name=item.name,
             start_ms=start_ms,
             duration_ms=segment_ms,
             playlist_index=self._index + 1,
@@ -161,10 +221,20 @@ class SegmentPlayer(QObject):
         self.media_player.play()
         self._segment_end_timer.start(segment_ms)
 
-        del self._pending_file
+    @Slot()
+    def _on_duration_timeout(self) -> None:
+        item = self._pending_item
+        if item is None:
+            return
+        self._pending_item = None
+        LOGGER.error("Could not read duration: %s", item.path)
+        self.playback_error.emit(f"Could not read duration: {item.path}")
 
     @Slot("QMediaPlayer::Error", str)
     def _on_error(self, _error: QMediaPlayer.Error, error_string: str) -> None:
+        # The error itself triggers a skip; don't report the same file again on timeout.
+        self._duration_timeout_timer.stop()
+        self._pending_item = None
         message = error_string or "Unknown playback error"
         LOGGER.error("Playback error: %s", message)
         self.playback_error.emit(message)
@@ -3,10 +3,20 @@
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
-import random
 
-from PySide6.QtCore import QObject, QThread, Signal, Slot, Qt
+from PySide6.QtCore import (
+    Q_ARG,
+    QMetaObject,
+    QObject,
+    QThread,
+    QTimer,
+    Signal,
+    Slot,
+    Qt,
+)
+from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtMultimediaWidgets import QVideoWidget
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -19,10 +29,10 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QMainWindow,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QSlider,
     QSpinBox,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
@@ -33,22 +43,46 @@ from player import SegmentInfo, SegmentPlayer
 
 LOGGER = logging.getLogger(__name__)
 
+# Number of discovered videos handed to the GUI thread per batch signal.
+_SCAN_BATCH_SIZE = 256
+
+# Log panel messages are coalesced and written at most this often.
+_LOG_FLUSH_INTERVAL_MS = 50
+_LOG_MAX_LINES = 2000
+
+# How long transient status bar messages stay visible.
+_STATUS_MESSAGE_MS = 4000
+
 
 class ScanWorker(QObject):
-    """Background scanner to keep UI responsive."""
+    """Long-lived background scanner living on its own thread to keep UI responsive."""
 
-    finished = Signal(list)
+    batch = Signal(list)
+    scan_complete = Signal(object, int)  # scanned folder, total files discovered
     failed = Signal(str)
+    progress = Signal(int, int)  # files seen, files matched
 
-    def __init__(self, folder: Path) -> None:
-        super().__init__()
-        self.folder = folder
-
-    @Slot()
-    def run(self) -> None:
+    @Slot(str)
+    def scan(self, folder_name: str) -> None:
+        folder = Path(folder_name)
+        thread = QThread.currentThread()
         try:
-            results = VideoLibrary.scan_folder(self.folder)
-            self.finished.emit(results)
+            total = 0
+            buffer: list[VideoItem] = []
+            for item in VideoLibrary.scan_folder(
+                folder, self.progress.emit, thread.isInterruptionRequested
+            ):
+                buffer.append(item)
+                if len(buffer) >= _SCAN_BATCH_SIZE:
+                    total += len(buffer)
+                    self.batch.emit(buffer)
+                    buffer = []
+            if thread.isInterruptionRequested():
+                return
+            if buffer:
+                total += len(buffer)
+                self.batch.emit(buffer)
+            self.scan_complete.emit(folder, total)
         except Exception as exc:  # noqa: BLE001
             self.failed.emit(str(exc))
 
@@ -62,10 +96,29 @@ class MainWindow(QMainWindow):
         self.resize(1200, 760)
 
         self.library = VideoLibrary()
-        self.playlist: list[Path] = []
         self.last_segment: SegmentInfo | None = None
+        self._scan_inflight = False
+        self._scan_results: list[VideoItem] = []
+        self._log_buffer: list[str] = []
 
         self._build_ui()
+        self._min_seconds, self._max_seconds = self._normalized_duration_range()
+
+        self._exit_fullscreen_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Escape), self)
+        self._exit_fullscreen_shortcut.setContext(Qt.ShortcutContext.WindowShortcut)
+        self._exit_fullscreen_shortcut.activated.connect(self._exit_fullscreen)
+
+        # One scanner thread for the lifetime of the window; scans are queued to it.
+        self._scan_thread = QThread(self)
+        self._scan_worker = ScanWorker()
+        self._scan_worker.moveToThread(self._scan_thread)
+        self._scan_worker.batch.connect(self._on_scan_batch)
+        self._scan_worker.scan_complete.connect(self._on_scan_complete)
+        self._scan_worker.failed.connect(self._on_scan_failed)
+        self._scan_worker.progress.connect(self._on_scan_progress)
+        self._scan_thread.finished.connect(self._scan_worker.deleteLater)
+        self._scan_thread.start()
+
         self.player = SegmentPlayer(self.video_widget, on_next_requested=self.on_next_clicked)
         self.player.segment_changed.connect(self._on_segment_changed)
         self.player.playback_error.connect(self._on_playback_error)
@@ -143,11 +196,17 @@ class MainWindow(QMainWindow):
         status_layout.addRow("Library:", self.library_label)
         layout.addWidget(status_group)
 
-        self.log_view = QTextEdit(self)
+        self.log_view = QPlainTextEdit(self)
         self.log_view.setReadOnly(True)
         self.log_view.setMinimumHeight(100)
+        self.log_view.setMaximumBlockCount(_LOG_MAX_LINES)
         layout.addWidget(self.log_view)
 
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(_LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log)
+
         self.pick_folder_btn.clicked.connect(self.on_pick_folder)
         self.rescan_btn.clicked.connect(self.on_rescan_clicked)
         self.start_btn.clicked.connect(self.on_start_clicked)
@@ -158,6 +217,8 @@ class MainWindow(QMainWindow):
         self.fullscreen_btn.clicked.connect(self.toggle_fullscreen)
         self.mute_box.toggled.connect(self.player_set_mute)
         self.volume_slider.valueChanged.connect(self.player_set_volume)
+        self.min_spin.valueChanged.connect(self._on_range_changed)
+        self.max_spin.valueChanged.connect(self._on_range_changed)
 
     @Slot()
     def on_pick_folder(self) -> None:
@@ -172,53 +233,66 @@ class MainWindow(QMainWindow):
     def on_rescan_clicked(self) -> None:
         folder = self.folder_line.text().strip()
         if not folder:
-            QMessageBox.information(self, "Pick a folder", "Please choose a video folder first.")
+            self.statusBar().showMessage("Please choose a video folder first.", _STATUS_MESSAGE_MS)
             return
         self.scan_folder(Path(folder))
 
     def scan_folder(self, folder: Path) -> None:
-        self.append_log(f"Scanning: {folder}")
-        self._scan_thread = QThread(self)
-        self._scan_worker = ScanWorker(folder)
-        self._scan_worker.moveToThread(self._scan_thread)
+        if self._scan_inflight:
+            self.append_log("Scan in progress. Wait for it to finish before rescanning.")
+            return
 
-        self._scan_thread.started.connect(self._scan_worker.run)
-        self._scan_worker.finished.connect(lambda items: self._on_scan_finished(folder, items))
-        self._scan_worker.failed.connect(self._on_scan_failed)
+        self.append_log(f"Scanning: {folder}")
+        self._scan_results = []
+        self._scan_inflight = True
+        QMetaObject.invokeMethod(
+            self._scan_worker,
+            "scan",
+            Qt.ConnectionType.QueuedConnection,
+            Q_ARG(str, os.fspath(folder)),
+        )
 
-        self._scan_worker.finished.connect(self._scan_thread.quit)
-        self._scan_worker.failed.connect(self._scan_thread.quit)
-        self._scan_thread.finished.connect(self._scan_worker.deleteLater)
-        self._scan_thread.finished.connect(self._scan_thread.deleteLater)
+    @Slot(int, int)
+    def _on_scan_progress(self, files_seen: int, matched: int) -> None:
+        self.library_label.setText(f"Scanning... {matched} .mp4 of {files_seen} files")
 
-        self._scan_thread.start()
+    @Slot(list)
+    def _on_scan_batch(self, items: list[VideoItem]) -> None:
+        # Batches are collected here and committed on completion, so a session started
+        # mid-scan keeps using the previous library.
+        self._scan_results.extend(items)
 
-    def _on_scan_finished(self, folder: Path, items: list[VideoItem]) -> None:
-        self.library.set_items(folder, items)
-        self.library_label.setText(f"{len(items)} files")
-        self.append_log(f"Scan complete: {len(items)} .mp4 files")
+    @Slot(object, int)
+    def _on_scan_complete(self, folder: Path, total: int) -> None:
+        self._scan_inflight = False
+        self.library.set_items(folder, self._scan_results)
+        self._scan_results = []
+        self.library_label.setText(f"{total} files")
+        self.append_log(f"Scan complete: {total} .mp4 files")
 
+    @Slot(str)
     def _on_scan_failed(self, message: str) -> None:
+        self._scan_inflight = False
+        self._scan_results = []
         LOGGER.exception("Scan failed: %s", message)
         self.append_log(f"Scan failed: {message}")
-        QMessageBox.warning(self, "Scan failed", message)
+        # Non-modal, so playback timers keep running while the warning is open.
+        dialog = QMessageBox(QMessageBox.Icon.Warning, "Scan failed", message, parent=self)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.setModal(False)
+        dialog.show()
 
     @Slot()
     def on_start_clicked(self) -> None:
         items = self.library.items
         if not items:
-            QMessageBox.warning(self, "No videos", "No .mp4 files discovered. Pick folder and rescan.")
+            self.statusBar().showMessage(
+                "No .mp4 files discovered. Pick folder and rescan.", _STATUS_MESSAGE_MS
+            )
             return
 
-        min_seconds = self.min_spin.value()
-        max_seconds = self.max_spin.value()
-        if min_seconds > max_seconds:
-            min_seconds, max_seconds = max_seconds, min_seconds
-
-        self.playlist = [item.path for item in items]
-        random.shuffle(self.playlist)
-        self.player.configure_playlist(self.playlist, loop=True)
-        self.player.play_next_segment(min_seconds, max_seconds)
+        self.player.configure_playlist(items, loop=True)
+        self.player.play_next_segment(self._min_seconds, self._max_seconds)
         self.append_log("Session started with shuffled playlist.")
 
     @Slot()
@@ -226,12 +300,18 @@ class MainWindow(QMainWindow):
         if not self.player.is_active():
             return
 
+        self.player.play_next_segment(self._min_seconds, self._max_seconds)
+
+    @Slot(int)
+    def _on_range_changed(self, _value: int) -> None:
+        self._min_seconds, self._max_seconds = self._normalized_duration_range()
+
+    def _normalized_duration_range(self) -> tuple[int, int]:
         min_seconds = self.min_spin.value()
         max_seconds = self.max_spin.value()
         if min_seconds > max_seconds:
             min_seconds, max_seconds = max_seconds, min_seconds
-
-        self.player.play_next_segment(min_seconds, max_seconds)
+        return min_seconds, max_seconds
 
     @Slot()
     def on_stop_clicked(self) -> None:
@@ -263,24 +343,30 @@ class MainWindow(QMainWindow):
         else:
             self.showFullScreen()
 
-    def keyPressEvent(self, event) -> None:  # noqa: N802
-        if event.key() == Qt.Key.Key_Escape and self.isFullScreen():
+    def closeEvent(self, event) -> None:  # noqa: N802
+        # Ask a running scan to stop early so wait() doesn't block on the rest of the tree.
+        self._scan_thread.requestInterruption()
+        self._scan_thread.quit()
+        self._scan_thread.wait()
+        super().closeEvent(event)
+
+    @Slot()
+    def _exit_fullscreen(self) -> None:
+        if self.isFullScreen():
             self.showNormal()
-            event.accept()
-            return
-        super().keyPressEvent(event)
 
     @Slot(object)
     def _on_segment_changed(self, info: SegmentInfo) -> None:
         self.last_segment = info
-        self.current_file_label.setText(info.file_path.name)
-        start_seconds = info.start_ms / 1000
-        dur_seconds = info.duration_ms / 1000
-        self.segment_label.setText(f"start={start_seconds:.2f}s | duration={dur_seconds:.2f}s")
+        file_name = info.file_name
+        start_s, start_ms = divmod(info.start_ms, 1000)
+        dur_s, dur_ms = divmod(info.duration_ms, 1000)
+        start_text = f"{start_s}.{start_ms // 10:02d}s"
+        dur_text = f"{dur_s}.{dur_ms // 10:02d}s"
+        self.current_file_label.setText(file_name)
+        self.segment_label.setText(f"start={start_text} | duration={dur_text}")
         self.progress_label.setText(f"{info.playlist_index} / {info.playlist_total}")
-        self.append_log(
-            f"Playing {info.file_path.name} from {start_seconds:.2f}s for {dur_seconds:.2f}s"
-        )
+        self.append_log(f"Playing {file_name} from {start_text} for {dur_text}")
 
     @Slot(str)
     def _on_playback_error(self, message: str) -> None:
@@ -291,6 +377,26 @@ class MainWindow(QMainWindow):
     def _on_queue_empty(self) -> None:
         self.append_log("Playlist empty. Add videos and rescan.")
 
+    @Slot(str)
     def append_log(self, message: str) -> None:
+        # Widgets may only be touched from the GUI thread; re-dispatch calls from workers.
+        if QThread.currentThread() is not self.thread():
+            QMetaObject.invokeMethod(
+                self,
+                "append_log",
+                Qt.ConnectionType.QueuedConnection,
+                Q_ARG(str, message),
+            )
+            return
+
         LOGGER.info(message)
-        self.log_view.append(message)
+        self._log_buffer.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    @Slot()
+    def _flush_log(self) -> None:
+        # One append per flush, so a burst of messages costs a single layout pass.
+        if self._log_buffer:
+            self.log_view.appendPlainText("\n".join(self._log_buffer))
+            self._log_buffer.clear()